@@ -0,0 +1,147 @@
+"""Пакетная (векторная) обработка тренировок в SoA-компоновке.
+
+Модуль дополняет homework.py: вместо объекта на каждую тренировку
+данные хранятся в массивах NumPy (structure of arrays), а калории
+считаются тремя векторными выражениями — по одному на тип тренировки.
+Требует установленный numpy.
+"""
+import sys
+from typing import List, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba необязателен: без него batch_info считает на чистом Python.
+    prange = range
+
+    def njit(**_kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+from homework import (InfoMessage, Running, SportsWalking, Swimming,
+                      Training)
+
+# Коды типов тренировок в массиве kind.
+RUN_ID: int = 0
+WLK_ID: int = 1
+SWM_ID: int = 2
+
+_KIND_IDS = {'RUN': RUN_ID, 'WLK': WLK_ID, 'SWM': SWM_ID}
+_KIND_NAMES = {RUN_ID: 'Running', WLK_ID: 'SportsWalking',
+               SWM_ID: 'Swimming'}
+
+
+def compute_calories(kind: np.ndarray,
+                     action: np.ndarray,
+                     duration: np.ndarray,
+                     weight: np.ndarray,
+                     height: np.ndarray,
+                     length_pool: np.ndarray,
+                     count_pool: np.ndarray) -> np.ndarray:
+    """Посчитать калории для всех тренировок разом по маскам типов."""
+    out = np.empty_like(duration)
+
+    m = kind == RUN_ID
+    speed = action[m] * Training.LEN_STEP / Training.M_IN_KM / duration[m]
+    out[m] = ((Running.CALORIES_MEAN_SPEED_MULTIPLIER * speed
+               + Running.CALORIES_MEAN_SPEED_SHIFT)
+              * weight[m] / Training.M_IN_KM
+              * duration[m] * Training.MIN_IN_H)
+
+    m = kind == WLK_ID
+    speed = (action[m] * Training.LEN_STEP / Training.M_IN_KM / duration[m]
+             * SportsWalking.KMH_IN_MSEC)
+    out[m] = ((SportsWalking.CALORIES_WEIGHT_MULTIPLIER * weight[m]
+               + (speed * speed / (height[m] / SportsWalking.CM_IN_M))
+               * SportsWalking.CALORIES_SPEED_HEIGHT_MULTIPLIER
+               * weight[m]) * duration[m] * Training.MIN_IN_H)
+
+    m = kind == SWM_ID
+    speed = (length_pool[m] * count_pool[m]
+             / Training.M_IN_KM / duration[m])
+    out[m] = ((speed + Swimming.CALORIES_MEAN_SPEED_SHIFT)
+              * Swimming.CALORIES_WEIGHT_MULTIPLIER
+              * weight[m] * duration[m])
+
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def batch_info(kind, action, duration, weight, height,
+               length_pool, count_pool, out_dist, out_speed, out_cal):
+    """Заполнить дистанцию, скорость и калории за один JIT-проход.
+
+    Деления вынесены в inv_duration и обратные константы, чтобы цикл
+    состоял из умножений и сложений и векторизовался LLVM; из-за
+    fastmath последние биты могут отличаться от compute_calories.
+    """
+    inv_duration = 1.0 / duration
+    for i in prange(len(kind)):
+        inv_d = inv_duration[i]
+        if kind[i] == RUN_ID:
+            distance = action[i] * 0.65 * 0.001
+            speed = distance * inv_d
+            calories = ((18 * speed + 1.79) * weight[i] * 0.001
+                        * duration[i] * 60)
+        elif kind[i] == WLK_ID:
+            distance = action[i] * 0.65 * 0.001
+            speed = distance * inv_d
+            speed_msec = speed * 0.278
+            calories = ((0.035 * weight[i]
+                         + speed_msec * speed_msec
+                         / (height[i] * 0.01) * 0.029 * weight[i])
+                        * duration[i] * 60)
+        else:
+            distance = action[i] * 1.38 * 0.001
+            speed = length_pool[i] * count_pool[i] * 0.001 * inv_d
+            calories = (speed + 1.1) * 2 * weight[i] * duration[i]
+        out_dist[i] = distance
+        out_speed[i] = speed
+        out_cal[i] = calories
+
+
+def read_packages(packages: List[Tuple[str, List[float]]]) -> tuple:
+    """Переложить пакеты датчиков в SoA-массивы NumPy."""
+    size = len(packages)
+    kind = np.empty(size, dtype=np.int64)
+    fields = np.zeros((6, size))
+    action, duration, weight, height, length_pool, count_pool = fields
+    for i, (workout_type, data) in enumerate(packages):
+        kind[i] = _KIND_IDS[workout_type]
+        action[i], duration[i], weight[i] = data[:3]
+        if kind[i] == WLK_ID:
+            height[i] = data[3]
+        elif kind[i] == SWM_ID:
+            length_pool[i], count_pool[i] = data[3:]
+    return (kind, action, duration, weight, height,
+            length_pool, count_pool)
+
+
+def main(packages: List[Tuple[str, List[float]]]) -> None:
+    """Посчитать весь пакет и напечатать сообщения одним выводом."""
+    (kind, action, duration, weight,
+     height, length_pool, count_pool) = read_packages(packages)
+    len_step = np.where(kind == SWM_ID, Swimming.LEN_STEP,
+                        Training.LEN_STEP)
+    distance = action * len_step / Training.M_IN_KM
+    speed = distance / duration
+    m = kind == SWM_ID
+    speed[m] = (length_pool[m] * count_pool[m]
+                / Training.M_IN_KM / duration[m])
+    calories = compute_calories(kind, action, duration, weight,
+                                height, length_pool, count_pool)
+    messages = [InfoMessage(_KIND_NAMES[k], du, di, sp, ca).get_message()
+                for k, du, di, sp, ca in zip(kind, duration, distance,
+                                             speed, calories)]
+    sys.stdout.write('\n'.join(messages) + '\n')
+
+
+if __name__ == '__main__':
+    main([
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 1, 75]),
+        ('WLK', [9000, 1, 75, 180]),
+    ])
@@ -1,9 +1,81 @@
-from abc import abstractmethod
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass
+from functools import cached_property
+from operator import attrgetter
 from typing import List
 
+try:
+    from numba import njit
+except ImportError:
+    # numba необязателен: без него формулы считаются на чистом Python.
+    def njit(**_kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
-@dataclass
+
+@njit(cache=True)
+def _run_cal(action: float, duration: float, weight: float) -> float:
+    """Калории за бег; арифметика совпадает с Running."""
+    speed = action * 0.65 / 1000 / duration
+    return (18 * speed + 1.79) * weight / 1000 * duration * 60
+
+
+@njit(cache=True)
+def _walk_cal(action: float, duration: float,
+              weight: float, height: float) -> float:
+    """Калории за спортивную ходьбу; арифметика как в SportsWalking."""
+    # v * v вместо v ** 2: обычное умножение вместо вызова pow().
+    speed_msec = action * 0.65 / 1000 / duration * 0.278
+    speed = speed_msec * speed_msec
+    return ((0.035 * weight + speed / (height / 100) * 0.029 * weight)
+            * duration * 60)
+
+
+@njit(cache=True)
+def _swim_cal(duration: float, weight: float,
+              length_pool: float, count_pool: float) -> float:
+    """Калории за плавание; арифметика как в Swimming."""
+    speed = length_pool * count_pool / 1000 / duration
+    return (speed + 1.1) * 2 * weight * duration
+
+
+@njit(cache=True)
+def _batch_cal(kind, action, duration, weight, height,
+               length_pool, count_pool, out):
+    """Заполнить out калориями для массивов тренировок.
+
+    Коды в kind: 0 — бег, 1 — ходьба, 2 — плавание.
+    """
+    for i in range(len(kind)):
+        if kind[i] == 0:
+            out[i] = _run_cal(action[i], duration[i], weight[i])
+        elif kind[i] == 1:
+            out[i] = _walk_cal(action[i], duration[i],
+                               weight[i], height[i])
+        else:
+            out[i] = _swim_cal(duration[i], weight[i],
+                               length_pool[i], count_pool[i])
+    return out
+
+
+# Прогрев: компиляция ядер не должна попадать в первый рабочий вызов.
+_run_cal(1.0, 1.0, 1.0)
+_walk_cal(1.0, 1.0, 1.0, 1.0)
+_swim_cal(1.0, 1.0, 1.0, 1.0)
+
+
+def _format_message(training_type: str, duration: float, distance: float,
+                    speed: float, calories: float) -> str:
+    """Собрать текст сообщения; f-строка разбирается при компиляции."""
+    return (f'Тип тренировки: {training_type};'
+            f' Длительность: {duration:.3f} ч.;'
+            f' Дистанция: {distance:.3f} км;'
+            f' Ср. скорость: {speed:.3f} км/ч;'
+            f' Потрачено ккал: {calories:.3f}.')
+
+
+@dataclass(slots=True)
 class InfoMessage:
     """Информационное сообщение о тренировке."""
     training_type: str
@@ -11,24 +83,22 @@ class InfoMessage:
     distance: float
     speed: float
     calories: float
-    imessage = ('Тип тренировки: {training_type};'
-                ' Длительность: {duration:.3f} ч.;'
-                ' Дистанция: {distance:.3f} км;'
-                ' Ср. скорость: {speed:.3f} км/ч;'
-                ' Потрачено ккал: {calories:.3f}.')
 
     def get_message(self) -> str:
-        result = self.imessage.format(**asdict(self))
-        return result
+        return _format_message(self.training_type, self.duration,
+                               self.distance, self.speed, self.calories)
 
 
 class Training:
-    MIN_IN_H: float = 60
-    M_IN_KM: float = 1000
+    MIN_IN_H: float = 60.0
+    M_IN_KM: float = 1000.0
     LEN_STEP: float = 0.65
     # 1.38 для плавания
     """Базовый класс тренировки."""
 
+    # Одно C-вызовное чтение трёх атрибутов вместо трёх LOAD_ATTR.
+    _INFO_FIELDS = attrgetter('duration', '_distance', '_mean_speed')
+
     def __init__(self,
                  action: int,
                  duration: float,
@@ -37,28 +107,37 @@ class Training:
         self.action = action
         self.duration = duration
         self.weight = weight
+        # Значение класса (0.65 или 1.38) закрепляется на экземпляре:
+        # дальше обычное чтение атрибута без поиска по MRO.
+        self.LEN_STEP = self.LEN_STEP
+
+    @cached_property
+    def _distance(self) -> float:
+        return self.action * self.LEN_STEP / self.M_IN_KM
+
+    @cached_property
+    def _mean_speed(self) -> float:
+        # преодолённая_дистанция_за_тренировку / время_тренировки
+        return self._distance / self.duration
 
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        result: float = self.action * self.LEN_STEP / self.M_IN_KM
-        return result
+        return self._distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        # return преодолённая_дистанция_за_тренировку / время_тренировки
-        result: float = self.get_distance() / self.duration
-        return result
+        return self._mean_speed
 
-    @abstractmethod
     def get_spent_calories(self) -> float:
+        # Формула своя у каждого вида тренировки; базовый класс
+        # ничего не считает.
         pass
 
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
         training_type = self.__class__.__name__
-        duration = self.duration
-        distance = self.get_distance()
-        speed = self.get_mean_speed()
+        # Дистанция и скорость считаются один раз и кешируются.
+        duration, distance, speed = self._INFO_FIELDS(self)
         calories = self.get_spent_calories()
         result = InfoMessage(training_type, duration,
                              distance, speed, calories)
@@ -73,12 +152,7 @@ class Running(Training):
     def get_spent_calories(self) -> float:
         # (18 * средняя_скорость + 1.79) * вес_спортсмена / M_IN_KM *
         # время_тренировки_в_минутах
-        result: float = (((self.CALORIES_MEAN_SPEED_MULTIPLIER
-                         * self.get_mean_speed()
-                         + self.CALORIES_MEAN_SPEED_SHIFT)
-                         * self.weight / self.M_IN_KM)
-                         * self.duration * self.MIN_IN_H)
-        return result
+        return _run_cal(self.action, self.duration, self.weight)
 
 
 class SportsWalking(Training):
@@ -88,7 +162,7 @@ class SportsWalking(Training):
     CALORIES_WEIGHT_MULTIPLIER: float = 0.035
     CALORIES_SPEED_HEIGHT_MULTIPLIER: float = 0.029
     KMH_IN_MSEC: float = 0.278
-    CM_IN_M: float = 100
+    CM_IN_M: float = 100.0
 
     def __init__(self,
                  action: int,
@@ -96,19 +170,18 @@ class SportsWalking(Training):
                  weight: float,
                  height: float,
                  ) -> None:
-        super().__init__(action, duration, weight)
+        # Атрибуты задаются напрямую, без кадра super().__init__.
+        self.action = action
+        self.duration = duration
+        self.weight = weight
+        self.LEN_STEP = self.LEN_STEP
         self.height = height
 
     def get_spent_calories(self) -> float:
         # ((0.035 * вес + (средняя_скорость_в_метрах_в_секунду**2 /
         # рост_в_метрах) * 0.029 * вес) * время_тренировки_в_минутах)
-        speed: float = (self.get_mean_speed() * self.KMH_IN_MSEC)**2
-        result: float = ((self.CALORIES_MEAN_SPEED_MULTIPLIER
-                         * (self.weight)
-                         + (speed / (self.height / self.CM_IN_M))
-                         * self.CALORIES_MEAN_SPEED_SHIFT
-                         * self.weight) * self.duration * self.MIN_IN_H)
-        return result
+        return _walk_cal(self.action, self.duration,
+                         self.weight, self.height)
 
 
 class Swimming(Training):
@@ -125,35 +198,44 @@ class Swimming(Training):
                  length_pool: float,
                  count_pool: float,
                  ) -> None:
-        super().__init__(action, duration, weight)
+        # Атрибуты задаются напрямую, без кадра super().__init__.
+        self.action = action
+        self.duration = duration
+        self.weight = weight
+        self.LEN_STEP = self.LEN_STEP
         self.length_pool = length_pool
         self.count_pool = count_pool
 
-    def get_mean_speed(self) -> float:
+    @cached_property
+    def _mean_speed(self) -> float:
         # длина_бассейна * count_pool / M_IN_KM / время_тренировки
-        result: float = (self.length_pool * self.count_pool
-                         / self.M_IN_KM / self.duration)
-        return result
+        return (self.length_pool * self.count_pool
+                / self.M_IN_KM / self.duration)
 
     def get_spent_calories(self) -> float:
         # (средняя_скорость + 1.1) * 2 * вес * время_тренировки
-        result = ((self.get_mean_speed() + self.CALORIES_MEAN_SPEED_SHIFT)
-                  * self.CALORIES_MEAN_SPEED_MULTIPLIER
-                  * (self.weight)
-                  * self.duration)
-        return result
+        return _swim_cal(self.duration, self.weight,
+                         self.length_pool, self.count_pool)
+
+
+# Класс тренировки и число полей в пакете; строится один раз.
+_DISPATCH = {'SWM': (Swimming, 5),
+             'RUN': (Running, 3),
+             'WLK': (SportsWalking, 4)}
 
 
-def read_package(workout_type: str, data: List[int]) -> Training:
+def read_package(workout_type: str, data: List[int],
+                 _dispatch=_DISPATCH) -> Training:
     """Прочитать данные полученные от датчиков."""
-    action_classes = {'SWM': Swimming,
-                      'RUN': Running,
-                      'WLK': SportsWalking}
-    if workout_type in action_classes:
-        action_class: Training = action_classes[workout_type](*data)
-        return action_class
-    else:
+    # _dispatch связан через аргумент по умолчанию: LOAD_FAST
+    # вместо LOAD_GLOBAL на каждый пакет.
+    entry = _dispatch.get(workout_type)
+    if entry is None:
         raise ValueError(f'Некорректный тип тренировки {workout_type} !')
+    action_class, arity = entry
+    assert len(data) == arity, (
+        f'Пакет {workout_type} должен содержать {arity} полей!')
+    return action_class(*data)
 
 
 def main(training: Training) -> None:
@@ -171,6 +253,8 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    # Один проход и один вывод вместо print на каждый пакет.
+    messages = (read_package(workout_type, data)
+                .show_training_info().get_message()
+                for workout_type, data in packages)
+    sys.stdout.write('\n'.join(messages) + '\n')